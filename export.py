@@ -0,0 +1,331 @@
+from array import array
+from itertools import accumulate, islice
+from json.encoder import encode_basestring
+import csv
+import json
+import math
+import struct
+import sys
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+EXPORT_FIELDS = ['date', 'amount', 'description', 'type', 'category']
+NUMERIC_FIELDS = {'amount', 'income', 'expense', 'expenses', 'balance'}
+CATEGORY_FIELDS = ['category', 'income', 'expenses', 'balance']
+MONTHLY_FIELDS = ['month', 'income', 'expense', 'balance', 'top_categories']
+EXPORT_FORMATS = ('csv', 'jsonl', 'columnar')
+BATCH_SIZE = 50000
+WRITE_BUFFER = 1024 * 1024
+COLUMNAR_MAGIC = b'FINCOL1\n'
+
+
+def iter_batches(transactions, batch_size: int = BATCH_SIZE):
+    """
+    Yield lists of up to batch_size transactions.
+    """
+    iterator = iter(transactions)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def get_columns(batch: list, fields: list) -> dict:
+    """
+    Turn a batch of transaction dictionaries into columns.
+    Missing and None values become 0.0 or an empty string.
+    """
+    columns = {}
+    for field in fields:
+        if field in NUMERIC_FIELDS:
+            columns[field] = [float(t.get(field) or 0) for t in batch]
+        else:
+            values = [t.get(field) for t in batch]
+            columns[field] = ['' if value is None else str(value) for value in values]
+    return columns
+
+
+def encode_json_numbers(values: list) -> list:
+    """
+    JSON-encode a numeric column; NaN and infinity become null.
+    """
+    encoded = list(map(float.__repr__, values))
+    if not all(map(math.isfinite, values)):
+        encoded = [
+            text if math.isfinite(value) else 'null'
+            for text, value in zip(encoded, values)
+        ]
+    return encoded
+
+
+def export_transactions_csv(transactions, filename: str,
+                            fields: list = None,
+                            batch_size: int = BATCH_SIZE) -> int:
+    """
+    Write categorized transactions to a CSV file in batches.
+    Returns the number of rows written.
+    """
+    fields = fields or EXPORT_FIELDS
+    count = 0
+    with open(filename, 'w', encoding='utf-8', newline='',
+              buffering=WRITE_BUFFER) as file:
+        writer = csv.writer(file)
+        writer.writerow(fields)
+        for batch in iter_batches(transactions, batch_size):
+            columns = get_columns(batch, fields)
+            writer.writerows(zip(*(columns[field] for field in fields)))
+            count += len(batch)
+    return count
+
+
+def export_transactions_jsonl(transactions, filename: str,
+                              fields: list = None,
+                              batch_size: int = BATCH_SIZE) -> int:
+    """
+    Write categorized transactions to a JSON Lines file in batches.
+    Values are JSON-encoded column by column and joined with a row
+    template, instead of encoding one dictionary per row.
+    Returns the number of rows written.
+    """
+    fields = fields or EXPORT_FIELDS
+    template = '{' + ','.join(
+        encode_basestring(field).replace('%', '%%') + ':%s' for field in fields
+    ) + '}'
+    count = 0
+    with open(filename, 'w', encoding='utf-8',
+              buffering=WRITE_BUFFER) as file:
+        for batch in iter_batches(transactions, batch_size):
+            columns = get_columns(batch, fields)
+            encoded = [
+                encode_json_numbers(columns[field])
+                if field in NUMERIC_FIELDS
+                else list(map(encode_basestring, columns[field]))
+                for field in fields
+            ]
+            lines = [template % row for row in zip(*encoded)]
+            lines.append('')
+            file.write('\n'.join(lines))
+            count += len(batch)
+    return count
+
+
+def write_binary_batch(file, columns: dict, fields: list, rows: int) -> None:
+    """
+    Write one row group of the stdlib columnar format.
+    Numbers are stored as little-endian float64, strings as UTF-8 data
+    with uint64 end offsets.
+    """
+    file.write(struct.pack('<I', rows))
+    for field in fields:
+        if field in NUMERIC_FIELDS:
+            values = array('d', columns[field])
+            if sys.byteorder == 'big':
+                values.byteswap()
+            file.write(values.tobytes())
+        else:
+            encoded = [value.encode('utf-8') for value in columns[field]]
+            offsets = array('Q', accumulate(map(len, encoded)))
+            if sys.byteorder == 'big':
+                offsets.byteswap()
+            file.write(offsets.tobytes())
+            file.write(b''.join(encoded))
+
+
+def export_transactions_columnar(transactions, filename: str,
+                                 fields: list = None,
+                                 batch_size: int = BATCH_SIZE,
+                                 use_arrow: bool = True) -> str:
+    """
+    Write categorized transactions column by column in row groups.
+    Uses Parquet when pyarrow is installed, otherwise a compact
+    stdlib binary format readable with read_columnar_file.
+    Returns the format used: 'parquet' or 'binary'.
+    """
+    fields = fields or EXPORT_FIELDS
+
+    if use_arrow and pyarrow is not None:
+        schema = pyarrow.schema([
+            (field, pyarrow.float64() if field in NUMERIC_FIELDS else pyarrow.string())
+            for field in fields
+        ])
+        with pyarrow.parquet.ParquetWriter(filename, schema) as writer:
+            for batch in iter_batches(transactions, batch_size):
+                columns = get_columns(batch, fields)
+                writer.write_table(pyarrow.table(columns, schema=schema))
+        return 'parquet'
+
+    header = json.dumps({
+        'fields': fields,
+        'numeric': [field for field in fields if field in NUMERIC_FIELDS]
+    }).encode('utf-8')
+
+    with open(filename, 'wb', buffering=WRITE_BUFFER) as file:
+        file.write(COLUMNAR_MAGIC)
+        file.write(struct.pack('<I', len(header)))
+        file.write(header)
+        for batch in iter_batches(transactions, batch_size):
+            columns = get_columns(batch, fields)
+            write_binary_batch(file, columns, fields, len(batch))
+    return 'binary'
+
+
+def read_columnar_file(filename: str) -> list:
+    """
+    Read a file written by export_transactions_columnar in binary format.
+    Returns the transactions as a list of dictionaries.
+    """
+    data = []
+    with open(filename, 'rb') as file:
+        if file.read(len(COLUMNAR_MAGIC)) != COLUMNAR_MAGIC:
+            raise ValueError(f"'{filename}' is not a columnar export file")
+        header_size = struct.unpack('<I', file.read(4))[0]
+        header = json.loads(file.read(header_size).decode('utf-8'))
+        fields = header['fields']
+        numeric = set(header['numeric'])
+
+        while True:
+            size_bytes = file.read(4)
+            if not size_bytes:
+                break
+            rows = struct.unpack('<I', size_bytes)[0]
+
+            columns = []
+            for field in fields:
+                if field in numeric:
+                    values = array('d')
+                    values.frombytes(file.read(rows * 8))
+                    if sys.byteorder == 'big':
+                        values.byteswap()
+                    columns.append(values.tolist())
+                else:
+                    offsets = array('Q')
+                    offsets.frombytes(file.read(rows * 8))
+                    if sys.byteorder == 'big':
+                        offsets.byteswap()
+                    blob = file.read(offsets[-1] if rows else 0)
+                    starts = [0] + offsets.tolist()[:-1]
+                    columns.append([
+                        blob[start:end].decode('utf-8')
+                        for start, end in zip(starts, offsets)
+                    ])
+
+            data.extend(dict(zip(fields, row)) for row in zip(*columns))
+
+    return data
+
+
+def get_category_rows(report: dict) -> list:
+    """
+    Turn the per-category totals of build_report into table rows.
+    """
+    income_by_category = report['income_by_category']
+    expenses_by_category = report['expenses_by_category']
+    rows = []
+    for category in sorted(set(income_by_category) | set(expenses_by_category)):
+        income = income_by_category.get(category, 0)
+        expenses = expenses_by_category.get(category, 0)
+        rows.append({
+            'category': category,
+            'income': income,
+            'expenses': expenses,
+            'balance': income - expenses
+        })
+    return rows
+
+
+def get_monthly_rows(report: dict) -> list:
+    """
+    Turn the monthly stats of build_report into table rows.
+    Top categories are joined with ';'.
+    """
+    return [
+        {
+            'month': month,
+            'income': data['income'],
+            'expense': data['expense'],
+            'balance': data['balance'],
+            'top_categories': ';'.join(data['top_categories'])
+        }
+        for month, data in report['monthly_stats'].items()
+    ]
+
+
+def get_exporter(file_format: str) -> tuple:
+    """
+    Return the table writer and file extension for one of EXPORT_FORMATS.
+    """
+    exporters = {
+        'csv': (export_transactions_csv, 'csv'),
+        'jsonl': (export_transactions_jsonl, 'jsonl'),
+        'columnar': (export_transactions_columnar,
+                     'parquet' if pyarrow is not None else 'bin')
+    }
+    if file_format not in exporters:
+        raise ValueError(f"Unsupported export format '{file_format}'")
+    return exporters[file_format]
+
+
+def export_transactions(transactions, prefix: str, file_format: str = 'csv') -> str:
+    """
+    Write categorized transactions to '<prefix>_transactions' with the
+    extension of file_format ('csv', 'jsonl' or 'columnar').
+    Returns the name of the written file.
+    """
+    exporter, extension = get_exporter(file_format)
+    filename = f"{prefix}_transactions.{extension}"
+    exporter(transactions, filename)
+    return filename
+
+
+def export_report_tables(report: dict, prefix: str, file_format: str = 'csv') -> list:
+    """
+    Write the per-category and monthly aggregates of build_report as
+    tables: '<prefix>_categories' and '<prefix>_monthly' with the
+    extension of file_format ('csv', 'jsonl' or 'columnar').
+    Returns the names of the written files.
+    """
+    exporter, extension = get_exporter(file_format)
+
+    tables = [
+        ('categories', get_category_rows(report), CATEGORY_FIELDS),
+        ('monthly', get_monthly_rows(report), MONTHLY_FIELDS)
+    ]
+    filenames = []
+    for name, rows, fields in tables:
+        filename = f"{prefix}_{name}.{extension}"
+        exporter(rows, filename, fields=fields)
+        filenames.append(filename)
+    return filenames
+
+
+def replace_non_finite(value):
+    """
+    Return a copy of nested dicts and lists with NaN and infinity
+    replaced by None, so the result is valid JSON.
+    """
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: replace_non_finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [replace_non_finite(item) for item in value]
+    return value
+
+
+def export_report_json(report: dict, filename: str) -> None:
+    """
+    Write role3/role4 aggregates (e.g. the result of build_report)
+    to a compact JSON file in a single buffered write.
+    NaN and infinity are written as null.
+    """
+    text = json.dumps(replace_non_finite(report), ensure_ascii=False,
+                      separators=(',', ':'), allow_nan=False)
+    with open(filename, 'w', encoding='utf-8',
+              buffering=WRITE_BUFFER) as file:
+        file.write(text)
\ No newline at end of file
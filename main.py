@@ -1,45 +1,23 @@
 from role1 import import_financial_data
 from role2 import categorize_all_transactions, get_classification_stats
+from role2 import create_keyword_stats, get_keyword_stats_report
 from role3 import calculate_basic_stats, calculate_by_category, analyze_by_time
 from role4 import analyze_historical_spending, create_budget_template, compare_budget_vs_actual
+from report_cache import make_cache_key, load_cached_report, save_cached_report
+from streaming_analytics import StreamingAnalytics
+from export import EXPORT_FORMATS, export_transactions, export_report_tables, export_report_json
 from collections import defaultdict
 from datetime import datetime, timedelta
+import argparse
 import json
 
 
-def main():
+def build_report(categorized_transactions: list) -> dict:
     """
-    main function
+    Compute all role3/role4 results shown by main.
     """
-    print("FINANCIAL ANALYSIS AND BUDGET PLANNING\n")
-
-    print("Import Financial Data\n")
-    filename = input("Enter the name of the data file (CSV or JSON): ").strip()
-
-    try:
-        transactions = import_financial_data(filename)
-        print(f"\nData successfully loaded")
-    except Exception as e:
-        print(f"Data upload error {e}")
-        return
-
-    if not transactions:
-        print("No data available for analysis")
-        return
-
-    categorized_transactions = categorize_all_transactions(transactions)
-
-    print("\nFinancial analysis")
     basic_stats = calculate_basic_stats(categorized_transactions)
 
-    print(f"\nKey indicators:\n")
-    print(f"   Income: {basic_stats['total_income']:,.2f} rub.")
-    print(f"   Expenses: {basic_stats['total_expense']:,.2f} rub.")
-    print(f"   Balance: {basic_stats['balance']:,.2f} rub.")
-    print(f"   Total transactions: {basic_stats['transactions_count']}")
-
-    print("\nCategorization of transactions\n")
-
     category_expenses = defaultdict(lambda: {'total': 0, 'count': 0})
     for transaction in categorized_transactions:
         if transaction.get('amount', 0) < 0:
@@ -48,8 +26,6 @@ def main():
             category_expenses[category]['total'] += amount
             category_expenses[category]['count'] += 1
 
-    total_expenses = sum(data['total'] for data in category_expenses.values())
-
     income_by_category = defaultdict(float)
     expenses_by_category = defaultdict(float)
 
@@ -62,6 +38,44 @@ def main():
         else:
             expenses_by_category[category] += abs(amount)
 
+    analytics = StreamingAnalytics()
+    monthly_stats = analyze_by_time(categorized_transactions, analytics)
+
+    spending_analysis = analyze_historical_spending(categorized_transactions)
+    budget_template = create_budget_template(spending_analysis)
+    budget_comparison = compare_budget_vs_actual(budget_template, categorized_transactions)
+
+    return {
+        'basic_stats': basic_stats,
+        'income_by_category': dict(income_by_category),
+        'expenses_by_category': dict(expenses_by_category),
+        'expense_categories_count': len(category_expenses),
+        'monthly_stats': monthly_stats,
+        'streaming_analytics': analytics.report(),
+        'spending_analysis': spending_analysis,
+        'budget_template': budget_template,
+        'budget_comparison': budget_comparison
+    }
+
+
+def print_report(report: dict) -> None:
+    """
+    Print the results computed by build_report.
+    """
+    print("\nFinancial analysis")
+    basic_stats = report['basic_stats']
+
+    print(f"\nKey indicators:\n")
+    print(f"   Income: {basic_stats['total_income']:,.2f} rub.")
+    print(f"   Expenses: {basic_stats['total_expense']:,.2f} rub.")
+    print(f"   Balance: {basic_stats['balance']:,.2f} rub.")
+    print(f"   Total transactions: {basic_stats['transactions_count']}")
+
+    print("\nCategorization of transactions\n")
+
+    income_by_category = report['income_by_category']
+    expenses_by_category = report['expenses_by_category']
+
     total_income = sum(income_by_category.values())
     total_expenses = sum(expenses_by_category.values())
 
@@ -84,12 +98,23 @@ def main():
         f" rub. {total_income - total_expenses:>12,.0f} rub.")
 
     print(f"\nTotal expenses: {total_expenses:,.2f} rub.")
-    print(f"Total expense categories: {len(category_expenses)}")
+    print(f"Total expense categories: {report['expense_categories_count']}")
+
+    streaming = report['streaming_analytics']
+
+    print("\nTop merchants by category (minimum counts)\n")
+    for category, merchants in streaming['top_merchants'].items():
+        names = ", ".join(f"{name} ({count})" for name, count in merchants)
+        print(f"   {category}: {names}")
+
+    print(f"\nUnusual spending: {streaming['alerts_total']} transactions")
+    for alert in streaming['alerts'][:5]:
+        print(f"   {alert['date']} {alert['description']} ({alert['category']}): "
+              f"{alert['amount']:,.2f} rub., usual up to {alert['threshold']:,.2f} rub.")
 
     print("\nBudget planning")
-    spending_analysis = analyze_historical_spending(categorized_transactions)
-    budget_template = create_budget_template(spending_analysis)
-    budget_comparison = compare_budget_vs_actual(budget_template, categorized_transactions)
+    spending_analysis = report['spending_analysis']
+    budget_comparison = report['budget_comparison']
     performance = budget_comparison['performance_summary']
     savings = budget_comparison['savings_comparison']
 
@@ -112,5 +137,126 @@ def main():
         print(f"   {i}. {recommendation}")
 
 
+def parse_export_option(value: str) -> tuple:
+    """
+    Split an --export value into a file prefix and a format.
+    """
+    prefix, _, file_format = value.rpartition(':')
+    if not prefix or file_format not in EXPORT_FORMATS:
+        return value, 'csv'
+    return prefix, file_format
+
+
+def export_results(prefix: str, file_format: str, report: dict,
+                   categorized_transactions: list = None) -> None:
+    """
+    Export the report tables, the report JSON and, when available,
+    the categorized transactions.
+    """
+    try:
+        filenames = export_report_tables(report, prefix, file_format)
+        export_report_json(report, f"{prefix}_report.json")
+        filenames.append(f"{prefix}_report.json")
+        if categorized_transactions is not None:
+            filenames.insert(0, export_transactions(
+                categorized_transactions, prefix, file_format
+            ))
+    except Exception as e:
+        print(f"\nExport error {e}")
+        return
+
+    print(f"\nExported: {', '.join(filenames)}")
+    if categorized_transactions is None:
+        print("   Transactions were not exported: the report came from the cache, "
+              "so they were never loaded. Run again after clearing "
+              ".report_cache to export them.")
+
+
+def parse_args(argv: list = None) -> argparse.Namespace:
+    """
+    Parse command line options of main.
+    """
+    parser = argparse.ArgumentParser(description="Financial analysis and budget planning")
+    parser.add_argument('--parallel', action='store_true',
+                        help="parse CSV files in a process pool")
+    parser.add_argument('--trace', metavar='FILE',
+                        help="write keyword statistics of categorization to a JSON file")
+    parser.add_argument('--max-traces', type=int, default=100, metavar='N',
+                        help="descriptions to explain in the trace file (default: 100)")
+    parser.add_argument('--export', type=parse_export_option, metavar='PREFIX[:FORMAT]',
+                        help="export transactions and report tables to files starting "
+                             f"with PREFIX; FORMAT is one of {', '.join(EXPORT_FORMATS)} "
+                             "(default: csv)")
+    return parser.parse_args(argv)
+
+
+def write_trace_report(stats: dict, filename: str) -> None:
+    """
+    Write categorization counters to a JSON file and print a summary
+    of keywords that never matched.
+    """
+    trace_report = get_keyword_stats_report(stats)
+    trace_report['traces'] = list(stats['traces'].values())
+    export_report_json(trace_report, filename)
+
+    dead_keywords = trace_report['dead_keywords']
+    dead_count = sum(len(keywords) for keywords in dead_keywords.values())
+    print(f"\nCategorization trace written to {filename}")
+    print(f"   Keywords that never matched: {dead_count}")
+    for category, keywords in trace_report['duplicate_keywords'].items():
+        print(f"   Duplicate keywords in {category}: {', '.join(keywords)}")
+
+
+def main():
+    """
+    main function
+    Run with --help to see the command line options.
+    """
+    args = parse_args()
+    print("FINANCIAL ANALYSIS AND BUDGET PLANNING\n")
+
+    print("Import Financial Data\n")
+    filename = input("Enter the name of the data file (CSV or JSON): ").strip()
+
+    try:
+        cache_key = make_cache_key(filename)
+    except Exception:
+        cache_key = None
+
+    report = None
+    if cache_key and not args.trace:
+        report = load_cached_report(cache_key)
+    if report:
+        print(f"\nReport loaded from cache")
+        print_report(report)
+        if args.export:
+            export_results(*args.export, report)
+        return
+
+    try:
+        transactions = import_financial_data(filename, parallel=args.parallel)
+        print(f"\nData successfully loaded")
+    except Exception as e:
+        print(f"Data upload error {e}")
+        return
+
+    if not transactions:
+        print("No data available for analysis")
+        return
+
+    stats = create_keyword_stats(max_traces=args.max_traces) if args.trace else None
+    categorized_transactions = categorize_all_transactions(transactions, stats)
+    if stats is not None:
+        write_trace_report(stats, args.trace)
+
+    report = build_report(categorized_transactions)
+    if cache_key:
+        save_cached_report(cache_key, report)
+
+    print_report(report)
+    if args.export:
+        export_results(*args.export, report, categorized_transactions)
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
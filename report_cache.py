@@ -0,0 +1,129 @@
+import hashlib
+import json
+import os
+import tempfile
+import zlib
+
+from role2 import get_rules_version
+from role4 import get_budget_period
+
+
+CACHE_DIR = '.report_cache'
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Bump when build_report or the role3/role4 results it stores change.
+REPORT_VERSION = 3
+
+
+def get_file_fingerprint(filename: str) -> dict:
+    """
+    Describe the input file by size, modification time and content hash.
+    """
+    file_hash = hashlib.sha256()
+    with open(filename, 'rb') as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b''):
+            file_hash.update(chunk)
+
+    file_stat = os.stat(filename)
+    return {
+        'size': file_stat.st_size,
+        'mtime': file_stat.st_mtime_ns,
+        'sha256': file_hash.hexdigest()
+    }
+
+
+def make_cache_key(filename: str) -> str:
+    """
+    Build the cache key from the file fingerprint, the rule-set version
+    and the report version. The budget period is included too, because
+    the budget template depends on the current month.
+    """
+    key_data = {
+        'file': get_file_fingerprint(filename),
+        'rules': get_rules_version(),
+        'report': REPORT_VERSION,
+        'period': get_budget_period()
+    }
+    key_text = json.dumps(key_data, sort_keys=True)
+    return hashlib.sha256(key_text.encode('utf-8')).hexdigest()
+
+
+def get_cache_path(key: str, cache_dir: str = CACHE_DIR) -> str:
+    """
+    Return the path of the cache entry for a key.
+    """
+    return os.path.join(cache_dir, f"{key}.json.z")
+
+
+def load_cached_report(key: str, cache_dir: str = CACHE_DIR) -> dict:
+    """
+    Load a cached report, or return None if there is no valid entry.
+    A hit refreshes the entry's modification time for LRU eviction.
+    """
+    path = get_cache_path(key, cache_dir)
+    try:
+        with open(path, 'rb') as file:
+            report = json.loads(zlib.decompress(file.read()).decode('utf-8'))
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Warning: Ignoring broken cache entry: {e}")
+        return None
+
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return report
+
+
+def save_cached_report(key: str, report: dict, cache_dir: str = CACHE_DIR,
+                       max_bytes: int = CACHE_MAX_BYTES) -> None:
+    """
+    Store a report as compressed JSON and evict old entries if needed.
+    Reports larger than max_bytes are not stored.
+    """
+    try:
+        payload = zlib.compress(
+            json.dumps(report, separators=(',', ':')).encode('utf-8')
+        )
+        if len(payload) > max_bytes:
+            return
+        os.makedirs(cache_dir, exist_ok=True)
+        path = get_cache_path(key, cache_dir)
+        descriptor, temp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(descriptor, 'wb') as file:
+                file.write(payload)
+            os.replace(temp_path, path)
+        except Exception:
+            os.remove(temp_path)
+            raise
+        evict_cache_entries(cache_dir, max_bytes, keep=path)
+    except Exception as e:
+        print(f"Warning: Could not save report to cache: {e}")
+
+
+def evict_cache_entries(cache_dir: str = CACHE_DIR,
+                        max_bytes: int = CACHE_MAX_BYTES,
+                        keep: str = None) -> None:
+    """
+    Delete the least recently used entries until the cache fits max_bytes.
+    The entry at path `keep` counts towards the size but is never deleted.
+    """
+    entries = []
+    for name in os.listdir(cache_dir):
+        if not name.endswith('.json.z'):
+            continue
+        path = os.path.join(cache_dir, name)
+        file_stat = os.stat(path)
+        entries.append((file_stat.st_mtime_ns, file_stat.st_size, path))
+
+    total_size = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total_size <= max_bytes:
+            break
+        if path == keep:
+            continue
+        os.remove(path)
+        total_size -= size
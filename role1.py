@@ -1,4 +1,70 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
 import json
+import os
+
+
+def clean_csv_line(line: str) -> str:
+    """
+    Strip whitespace and the quotes wrapping a whole CSV line.
+    """
+    clean_line = line.strip()
+    if clean_line.startswith('"') and clean_line.endswith('"'):
+        clean_line = clean_line[1:-1]
+    return clean_line
+
+
+def split_csv_line(line: str) -> list:
+    """
+    Split a CSV line into fields, ignoring commas inside quotes.
+    """
+    fields = []
+    current_field = ""
+    in_quotes = False
+
+    for char in line:
+        if char == '"':
+            in_quotes = not in_quotes
+        elif char == ',' and not in_quotes:
+            fields.append(current_field.strip())
+            current_field = ""
+        else:
+            current_field += char
+    fields.append(current_field.strip())
+
+    return fields
+
+
+def parse_csv_rows(lines: list, headers: list) -> list:
+    """
+    Convert cleaned CSV lines into dictionaries keyed by headers.
+    """
+    data = []
+    for line in lines:
+        if not line.strip():
+            continue
+
+        values = split_csv_line(line)
+
+        try:
+            row_dict = {}
+            for i, header in enumerate(headers):
+                if i < len(values):
+                    value = values[i]
+                    if header == 'amount':
+                        try:
+                            value = float(value)
+                        except ValueError:
+                            value = 0.0
+                    row_dict[header] = value
+
+            data.append(row_dict)
+
+        except Exception as e:
+            print(f"Warning: Skipping malformed row: {e}")
+            continue
+
+    return data
 
 
 def read_csv_file(filename: str) -> list:
@@ -12,68 +78,107 @@ def read_csv_file(filename: str) -> list:
 
             lines = []
             for line in content.split('\n'):
-                clean_line = line.strip()
+                clean_line = clean_csv_line(line)
                 if clean_line:
-                    if clean_line.startswith('"') and clean_line.endswith('"'):
-                        clean_line = clean_line[1:-1]
                     lines.append(clean_line)
 
             if not lines:
                 return []
 
-            first_line = lines[0]
+            headers = split_csv_line(lines[0])
+
+            return parse_csv_rows(lines[1:], headers)
+
+    except FileNotFoundError:
+        print(f"Error: File '{filename}' not found")
+        return []
+    except Exception as e:
+        print(f"Error reading CSV file: {e}")
+        return []
+
+
+def find_csv_shards(filename: str, data_start: int, shard_count: int) -> list:
+    """
+    Split the data part of a CSV file into byte ranges.
+    Every range starts right after a newline, so no line is cut in two.
+    Returns a list of (start, end) offsets.
+    """
+    file_size = os.path.getsize(filename)
+    shard_size = max(1, (file_size - data_start) // shard_count)
+
+    shards = []
+    with open(filename, 'rb') as file:
+        start = data_start
+        while start < file_size:
+            end = min(start + shard_size, file_size)
+            if end < file_size:
+                file.seek(end)
+                file.readline()
+                end = file.tell()
+            shards.append((start, end))
+            start = end
+
+    return shards
+
+
+def parse_csv_shard(filename: str, start: int, end: int, headers: list) -> list:
+    """
+    Parse one byte range of a CSV file with the given headers.
+    """
+    with open(filename, 'rb') as file:
+        file.seek(start)
+        chunk = file.read(end - start).decode('utf-8')
+
+    lines = []
+    for line in chunk.split('\n'):
+        clean_line = clean_csv_line(line)
+        if clean_line:
+            lines.append(clean_line)
+
+    return parse_csv_rows(lines, headers)
+
+
+def read_csv_file_parallel(filename: str, workers: Optional[int] = None,
+                           min_shard_size: int = 4 * 1024 * 1024) -> list:
+    """
+    Read a CSV file by parsing byte-range shards in a process pool.
+    Rows are returned in the original file order. Small files are
+    read with read_csv_file, as starting processes would cost more.
+    Each shard's rows are pickled back to this process, so the gain
+    depends on parsing being slower than that transfer.
+    """
+    try:
+        workers = workers or os.cpu_count() or 1
+
+        with open(filename, 'rb') as file:
             headers = []
-            current_field = ""
-            in_quotes = False
-
-            for char in first_line:
-                if char == '"':
-                    in_quotes = not in_quotes
-                elif char == ',' and not in_quotes:
-                    headers.append(current_field.strip())
-                    current_field = ""
-                else:
-                    current_field += char
-            headers.append(current_field.strip())
-
-            data = []
-            for line in lines[1:]:
-                if not line.strip():
-                    continue
-
-                values = []
-                current_value = ""
-                in_quotes = False
-
-                for char in line:
-                    if char == '"':
-                        in_quotes = not in_quotes
-                    elif char == ',' and not in_quotes:
-                        values.append(current_value.strip())
-                        current_value = ""
-                    else:
-                        current_value += char
-                values.append(current_value.strip())
-
-                try:
-                    row_dict = {}
-                    for i, header in enumerate(headers):
-                        if i < len(values):
-                            value = values[i]
-                            if header == 'amount':
-                                try:
-                                    value = float(value)
-                                except ValueError:
-                                    value = 0.0
-                            row_dict[header] = value
-
-                    data.append(row_dict)
-
-                except Exception as e:
-                    print(f"Warning: Skipping malformed row: {e}")
-                    continue
-
-            return data
+            for raw_line in iter(file.readline, b''):
+                clean_line = clean_csv_line(raw_line.decode('utf-8'))
+                if clean_line:
+                    headers = split_csv_line(clean_line)
+                    break
+            data_start = file.tell()
+
+        if not headers:
+            return []
+
+        data_size = os.path.getsize(filename) - data_start
+        shard_count = min(workers, data_size // min_shard_size)
+        if shard_count <= 1:
+            return read_csv_file(filename)
+
+        shards = find_csv_shards(filename, data_start, shard_count)
+
+        data = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(parse_csv_shard, filename, start, end, headers)
+                for start, end in shards
+            ]
+            for future in futures:
+                data.extend(future.result())
+
+        return data
 
     except FileNotFoundError:
         print(f"Error: File '{filename}' not found")
@@ -106,12 +211,16 @@ def read_json_file(filename: str) -> list:
         return []
 
 
-def import_financial_data(filename: str) -> list:
+def import_financial_data(filename: str, parallel: bool = False) -> list:
     """
     Import financial data from CSV or JSON files.
+    With parallel=True, CSV files are parsed in shards across processes.
     """
     if filename.lower().endswith('.csv'):
-        data = read_csv_file(filename)
+        if parallel:
+            data = read_csv_file_parallel(filename)
+        else:
+            data = read_csv_file(filename)
     elif filename.lower().endswith('.json'):
         data = read_json_file(filename)
     else:
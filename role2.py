@@ -1,5 +1,16 @@
 from collections import defaultdict
+import hashlib
+import json
 import re
+import time
+
+
+RULES_REVISION = 1
+
+PRIORITY_ORDER = [
+    "finance", "health", "home_services", "education",
+    "transport", "food", "subscriptions", "auto"
+]
 
 
 def create_categories() -> dict:
@@ -129,6 +140,22 @@ def create_categories() -> dict:
     }
 
 
+def get_rules_version() -> str:
+    """
+    Build a version string for the current categorization rules.
+
+    Returns:
+        String combining RULES_REVISION with a hash of the keywords
+        and the priority order, so any rule change gives a new version.
+    """
+    rules = json.dumps(
+        {'categories': create_categories(), 'priority': PRIORITY_ORDER},
+        sort_keys=True
+    )
+    digest = hashlib.sha256(rules.encode('utf-8')).hexdigest()[:16]
+    return f"{RULES_REVISION}-{digest}"
+
+
 def get_keyword_match_score(description: str, keyword: str) -> int:
     """
     Calculate the match score between a description and a keyword.
@@ -151,21 +178,18 @@ def get_keyword_match_score(description: str, keyword: str) -> int:
     return 0
 
 
-def pick_best_category(category_scores: dict) -> str:
+def select_category(category_scores: dict) -> tuple:
     """
-    Select the best category from scored categories using priority rules.
+    Select the best category and report how the choice was made.
 
     Args:
         category_scores: Dictionary with category names as keys and scores as values.
 
     Returns:
-        String representing the selected category name.
+        Tuple of the selected category, the list of categories tied for the
+        best score (empty if there was no tie) and whether the tie was
+        resolved by the priority order.
     """
-    priority_order = [
-        "finance", "health", "home_services", "education",
-        "transport", "food", "subscriptions", "auto"
-    ]
-
     best_score = max(category_scores.values())
 
     top_candidates = [
@@ -174,53 +198,240 @@ def pick_best_category(category_scores: dict) -> str:
     ]
 
     if len(top_candidates) == 1:
-        return top_candidates[0]
+        return top_candidates[0], [], False
 
-    for important_category in priority_order:
+    for important_category in PRIORITY_ORDER:
         if important_category in top_candidates:
-            return important_category
+            return important_category, top_candidates, True
 
-    return top_candidates[0]
+    return top_candidates[0], top_candidates, False
 
 
-def categorize_transaction(description: str, categories: dict) -> str:
+def pick_best_category(category_scores: dict) -> str:
     """
-    Categorize a single transaction based on its description.
+    Select the best category from scored categories using priority rules.
 
     Args:
-        description: The transaction description text.
+        category_scores: Dictionary with category names as keys and scores as values.
+
+    Returns:
+        String representing the selected category name.
+    """
+    return select_category(category_scores)[0]
+
+
+def score_categories(description: str, categories: dict,
+                     stats: dict = None) -> tuple:
+    """
+    Score a cleaned description against every category's keywords.
+
+    Args:
+        description: Lowercased, stripped transaction description.
         categories: Dictionary of categories and their keywords.
+        stats: Optional counters from create_keyword_stats(); per-keyword
+            hits and time are added to them.
 
     Returns:
-        String representing the assigned category or "other" if no match found.
+        Tuple of the keyword hits as (category, keyword, score) tuples and
+        a dictionary of positive scores per category.
     """
-    if not description or not isinstance(description, str):
-        return "other"
-    
-    clean_description = description.lower().strip()
-    scores = defaultdict(int)
+    hits = []
+    scores = {}
 
     for category_name, keywords in categories.items():
         category_score = 0
         
         for keyword in keywords:
-            category_score += get_keyword_match_score(clean_description, keyword)
+            if stats is None:
+                score = get_keyword_match_score(description, keyword)
+            else:
+                started = time.perf_counter()
+                score = get_keyword_match_score(description, keyword)
+                key = (category_name, keyword)
+                stats['keyword_time'][key] += time.perf_counter() - started
+                if score > 0:
+                    stats['keyword_hits'][key] += 1
+
+            if score > 0:
+                hits.append((category_name, keyword, score))
+                category_score += score
 
         if category_score > 0:
             scores[category_name] = category_score
 
-    if scores:
-        return pick_best_category(scores)
+    return hits, scores
+
+
+def explain_transaction(description: str, categories: dict,
+                        stats: dict = None) -> dict:
+    """
+    Categorize a transaction and record why the category was chosen.
+
+    Args:
+        description: The transaction description text.
+        categories: Dictionary of categories and their keywords.
+        stats: Optional counters from create_keyword_stats() to update.
+
+    Returns:
+        Dictionary with the keyword hits and their scores, the total score
+        per category, the chosen category, the tied categories and whether
+        the tie was resolved by the priority order.
+    """
+    hits = []
+    scores = {}
+    category = "other"
+    tied_categories = []
+    resolved_by_priority = False
+
+    if description and isinstance(description, str):
+        hits, scores = score_categories(
+            description.lower().strip(), categories, stats
+        )
+        if scores:
+            category, tied_categories, resolved_by_priority = select_category(scores)
+
+    if stats is not None:
+        stats['total_processed'] += 1
+        for category_name in scores:
+            stats['category_hits'][category_name] += 1
+        stats['category_wins'][category] += 1
+        if resolved_by_priority:
+            stats['priority_wins'][category] += 1
+
+    explanation = {
+        'description': description,
+        'hits': [
+            {'category': category_name, 'keyword': keyword, 'score': score}
+            for category_name, keyword, score in hits
+        ],
+        'scores': scores,
+        'category': category,
+        'tied_categories': tied_categories,
+        'resolved_by_priority': resolved_by_priority
+    }
+
+    if stats is not None:
+        traces = stats['traces']
+        if (isinstance(description, str) and description not in traces
+                and len(traces) < stats['max_traces']):
+            traces[description] = explanation
+
+    return explanation
+
+
+def categorize_transaction(description: str, categories: dict,
+                           stats: dict = None) -> str:
+    """
+    Categorize a single transaction based on its description.
+
+    Args:
+        description: The transaction description text.
+        categories: Dictionary of categories and their keywords.
+        stats: Optional counters from create_keyword_stats() to update.
+
+    Returns:
+        String representing the assigned category or "other" if no match found.
+    """
+    return explain_transaction(description, categories, stats)['category']
 
-    return "other"
 
+def create_keyword_stats(max_traces: int = 0) -> dict:
+    """
+    Create empty counters for categorization instrumentation.
+
+    Args:
+        max_traces: How many distinct descriptions to keep full
+            explanations for; 0 keeps none. The other counters have
+            a fixed size set by the keyword lists.
+
+    Returns:
+        Dictionary of counters filled by explain_transaction.
+    """
+    return {
+        'keyword_hits': defaultdict(int),
+        'keyword_time': defaultdict(float),
+        'category_hits': defaultdict(int),
+        'category_wins': defaultdict(int),
+        'priority_wins': defaultdict(int),
+        'traces': {},
+        'max_traces': max_traces,
+        'total_processed': 0
+    }
 
-def categorize_all_transactions(transactions: list) -> list:
+
+def get_keyword_stats_report(stats: dict, categories: dict = None) -> dict:
+    """
+    Build a report from categorization counters.
+
+    Args:
+        stats: Counters filled by explain_transaction.
+        categories: Dictionary of categories and their keywords;
+            create_categories() is used when omitted.
+
+    Returns:
+        Dictionary with per-category hits, wins, ties resolved by priority
+        and time spent, per-keyword hits and time, keywords that never
+        matched and keywords listed more than once in a category.
+        A duplicated keyword is matched once per listing, so its hits
+        are divided by the number of listings and its time is the total.
+    """
+    if categories is None:
+        categories = create_categories()
+
+    report = {
+        'total_processed': stats['total_processed'],
+        'total_time': round(sum(stats['keyword_time'].values()), 6),
+        'categories': {},
+        'dead_keywords': {},
+        'duplicate_keywords': {}
+    }
+
+    for category_name, keywords in categories.items():
+        listings = defaultdict(int)
+        for keyword in keywords:
+            listings[keyword] += 1
+
+        keyword_report = {}
+        dead_keywords = []
+        category_time = 0.0
+
+        for keyword, listed in listings.items():
+            key = (category_name, keyword)
+            hits = stats['keyword_hits'].get(key, 0) // listed
+            spent = stats['keyword_time'].get(key, 0.0)
+            keyword_report[keyword] = {
+                'hits': hits,
+                'time': round(spent, 6),
+                'listed': listed
+            }
+            category_time += spent
+            if hits == 0:
+                dead_keywords.append(keyword)
+
+        report['categories'][category_name] = {
+            'hits': stats['category_hits'].get(category_name, 0),
+            'wins': stats['category_wins'].get(category_name, 0),
+            'priority_wins': stats['priority_wins'].get(category_name, 0),
+            'time': round(category_time, 6),
+            'keywords': keyword_report
+        }
+        if dead_keywords:
+            report['dead_keywords'][category_name] = dead_keywords
+
+        duplicates = [keyword for keyword, listed in listings.items() if listed > 1]
+        if duplicates:
+            report['duplicate_keywords'][category_name] = duplicates
+
+    return report
+
+
+def categorize_all_transactions(transactions: list, stats: dict = None) -> list:
     """
     Categorize all transactions in a list by adding category fields.
 
     Args:
         transactions: List of transaction dictionaries.
+        stats: Optional counters from create_keyword_stats() to update.
 
     Returns:
         List of transactions with added 'category' field for each transaction.
@@ -232,7 +443,8 @@ def categorize_all_transactions(transactions: list) -> list:
         categorized_transaction = transaction.copy()
         categorized_transaction['category'] = categorize_transaction(
             transaction.get('description', ''), 
-            category_map
+            category_map,
+            stats
         )
         processed_transactions.append(categorized_transaction)
     
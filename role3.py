@@ -66,13 +66,15 @@ def calculate_by_category(transactions: list) -> dict:
     return result
 
 
-def analyze_by_time(transactions: list) -> dict:
+def analyze_by_time(transactions: list, analytics=None) -> dict:
     """
     Analyzes transaction dynamics by month:
       - income
       - expenses
       - balance
       - top spending categories
+    If analytics (e.g. StreamingAnalytics) is given, its update() is
+    called for every transaction in the same pass, dated or not.
     """
     monthly_stats = defaultdict(lambda: {
         'income': 0,
@@ -80,6 +82,8 @@ def analyze_by_time(transactions: list) -> dict:
         'top_categories': defaultdict(int)
     })
     for t in transactions:
+        if analytics is not None:
+            analytics.update(t)
         date_str = t.get('date')
         if not date_str:
             continue
@@ -42,6 +42,16 @@ def analyze_historical_spending(transactions: list) -> dict:
     }
 
 
+def get_budget_period() -> str:
+    """
+    Get the period the budget is planned for.
+    Returns:
+        Next month as a "YYYY-MM" string
+    """
+    return (datetime.now().replace(day=28) +
+            timedelta(days=4)).replace(day=1).strftime("%Y-%m")
+
+
 def create_budget_template(analysis: dict) -> dict:
     """
     Create budget template from spending analysis.
@@ -58,8 +68,7 @@ def create_budget_template(analysis: dict) -> dict:
     planned_savings = round(estimated_income - sum(category_limits.values()), 2)
 
     return {
-        'period': (datetime.now().replace(day=28) +
-                   timedelta(days=4)).replace(day=1).strftime("%Y-%m"),
+        'period': get_budget_period(),
         'estimated_income': estimated_income,
         'category_limits': category_limits,
         'planned_savings': planned_savings
@@ -0,0 +1,198 @@
+from collections import defaultdict
+from typing import Optional
+import math
+
+
+class SpaceSaving:
+    """
+    Space-Saving heavy hitters sketch.
+    Keeps at most `capacity` counters; counts of frequent items are
+    overestimated by no more than the stored error.
+    """
+
+    def __init__(self, capacity: int = 20):
+        self.capacity = capacity
+        self.counters = {}
+
+    def update(self, item: str, weight: int = 1) -> None:
+        """Count one more occurrence of an item."""
+        if item in self.counters:
+            self.counters[item][0] += weight
+        elif len(self.counters) < self.capacity:
+            self.counters[item] = [weight, 0]
+        else:
+            min_item = min(self.counters, key=lambda key: self.counters[key][0])
+            min_count = self.counters.pop(min_item)[0]
+            self.counters[item] = [min_count + weight, min_count]
+
+    def top(self, n: int) -> list:
+        """
+        Return up to n (item, guaranteed count) pairs, most frequent first.
+        The guaranteed count is the estimate minus its error, a lower bound
+        of the true count; items with nothing guaranteed are left out.
+        """
+        guaranteed = [
+            (item, count - error)
+            for item, (count, error) in self.counters.items()
+            if count - error > 0
+        ]
+        guaranteed.sort(key=lambda x: x[1], reverse=True)
+        return guaranteed[:n]
+
+
+class P2Quantile:
+    """
+    P-square streaming estimator of a single quantile.
+    Uses five markers, so memory does not grow with the stream.
+    """
+
+    def __init__(self, p: float):
+        self.p = p
+        self.count = 0
+        self.heights = []
+        self.positions = [0, 1, 2, 3, 4]
+        self.desired = [0, 2 * p, 4 * p, 2 + 2 * p, 4]
+        self.increments = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def update(self, value: float) -> None:
+        """Add one observation."""
+        self.count += 1
+        if self.count <= 5:
+            self.heights.append(value)
+            self.heights.sort()
+            return
+
+        q = self.heights
+        n = self.positions
+        if value < q[0]:
+            q[0] = value
+            k = 0
+        elif value >= q[4]:
+            q[4] = value
+            k = 3
+        else:
+            k = 0
+            while value >= q[k + 1]:
+                k += 1
+
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self.desired[i] += self.increments[i]
+
+        for i in range(1, 4):
+            d = self.desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                height = self._parabolic(i, d)
+                if not q[i - 1] < height < q[i + 1]:
+                    height = q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+                q[i] = height
+                n[i] += d
+
+    def _parabolic(self, i: int, d: int) -> float:
+        """Piecewise-parabolic prediction of marker i moved by d."""
+        q = self.heights
+        n = self.positions
+        return q[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def value(self) -> float:
+        """Return the current quantile estimate."""
+        if not self.heights:
+            return 0.0
+        if self.count <= 5:
+            index = round(self.p * (len(self.heights) - 1))
+            return self.heights[index]
+        return self.heights[2]
+
+
+class StreamingAnalytics:
+    """
+    Bounded-memory per-category analytics for expenses:
+      - top merchants (descriptions) using Space-Saving
+      - amount quartiles using P-square estimators
+      - alerts for amounts far above the category's usual spend
+
+    Pass an instance to analyze_by_time to fill it in the same pass.
+    Keep capacity well above top_n, so evictions do not crowd out
+    frequent merchants.
+    """
+
+    def __init__(self, capacity: int = 100, top_n: int = 3, warmup: int = 20,
+                 iqr_factor: float = 1.5, max_alerts: int = 1000):
+        self.top_n = top_n
+        self.warmup = warmup
+        self.iqr_factor = iqr_factor
+        self.max_alerts = max_alerts
+        self.merchants = defaultdict(lambda: SpaceSaving(capacity))
+        self.quantiles = defaultdict(
+            lambda: [P2Quantile(0.25), P2Quantile(0.5), P2Quantile(0.75)]
+        )
+        self.alerts = []
+        self.alerts_total = 0
+
+    def get_threshold(self, category: str) -> Optional[float]:
+        """
+        Return the outlier threshold for a category, or None while there
+        are too few observations to judge.
+        """
+        q25, median, q75 = self.quantiles[category]
+        if median.count < self.warmup:
+            return None
+        iqr = q75.value() - q25.value()
+        return q75.value() + self.iqr_factor * iqr
+
+    def update(self, transaction: dict) -> None:
+        """Process one transaction; income and non-finite amounts are ignored."""
+        amount = transaction.get('amount', 0)
+        if not math.isfinite(amount) or amount >= 0:
+            return
+        amount = abs(amount)
+        category = transaction.get('category', 'other')
+        description = str(transaction.get('description', '')).lower().strip()
+
+        threshold = self.get_threshold(category)
+        if threshold is not None and amount > threshold:
+            self.alerts_total += 1
+            if len(self.alerts) < self.max_alerts:
+                self.alerts.append({
+                    'date': transaction.get('date', ''),
+                    'description': transaction.get('description', ''),
+                    'category': category,
+                    'amount': round(amount, 2),
+                    'threshold': round(threshold, 2)
+                })
+
+        if description:
+            self.merchants[category].update(description)
+        for estimator in self.quantiles[category]:
+            estimator.update(amount)
+
+    def report(self) -> dict:
+        """
+        Summarize collected data:
+          - top merchants per category, with guaranteed minimum counts
+          - amount quartiles per category
+          - unusual-spend alerts
+        """
+        top_merchants = {
+            category: sketch.top(self.top_n)
+            for category, sketch in sorted(self.merchants.items())
+        }
+        amount_quantiles = {
+            category: {
+                'p25': round(q25.value(), 2),
+                'median': round(median.value(), 2),
+                'p75': round(q75.value(), 2)
+            }
+            for category, (q25, median, q75) in sorted(self.quantiles.items())
+        }
+        return {
+            'top_merchants': top_merchants,
+            'amount_quantiles': amount_quantiles,
+            'alerts': self.alerts,
+            'alerts_total': self.alerts_total
+        }
\ No newline at end of file